@@ -0,0 +1,76 @@
+import hashlib
+
+
+class ETagMiddleware:
+    """
+    ASGI middleware that adds an ETag to successful GET responses and
+    answers matching If-None-Match requests with 304 Not Modified.
+
+    The ETag is a hash of the response body, so the endpoint still runs; the
+    saving is on the wire and in the client's JSON decoding. It is a weak
+    tag because the same value is served for compressed and uncompressed
+    representations of the body.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+
+        start_message = None
+        body_parts = []
+
+        async def buffer_send(message):
+            nonlocal start_message
+            if message["type"] == "http.response.start":
+                start_message = message
+                return
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body_parts.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+
+            body = b"".join(body_parts)
+            if start_message["status"] != 200:
+                await send(start_message)
+                await send({"type": "http.response.body", "body": body})
+                return
+
+            etag = f'W/"{hashlib.sha1(body).hexdigest()}"'.encode("latin-1")
+            headers = [(k, v) for k, v in start_message["headers"] if k.lower() != b"etag"]
+            headers.append((b"etag", etag))
+
+            if _weak_match(etag, _if_none_match(scope)):
+                headers = [(k, v) for k, v in headers if k.lower() not in (b"content-length", b"content-type")]
+                await send({"type": "http.response.start", "status": 304, "headers": headers})
+                await send({"type": "http.response.body", "body": b""})
+                return
+
+            await send({**start_message, "headers": headers})
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, buffer_send)
+
+
+def _weak_match(etag, tags):
+    """
+    Weak comparison (RFC 9110): tags match if their opaque parts are equal.
+    """
+    opaque = etag.removeprefix(b"W/")
+    return any(tag == b"*" or tag.removeprefix(b"W/") == opaque for tag in tags)
+
+
+def _if_none_match(scope):
+    """
+    Return the entity tags listed in the request's If-None-Match header.
+    """
+    for key, value in scope["headers"]:
+        if key.lower() == b"if-none-match":
+            return [tag.strip() for tag in value.split(b",")]
+    return []
@@ -43,6 +43,41 @@ def get_polls(skip: int = 0, limit: int = 10, db: Session = Depends(get_db)):
     return polls
 
 
+@router.get("/polls/results")
+def get_polls_results(ids: str, db: Session = Depends(get_db)):
+    # Parse the comma-separated poll IDs, keeping request order without duplicates
+    try:
+        poll_ids = list(dict.fromkeys(int(poll_id) for poll_id in ids.split(",") if poll_id.strip()))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="ids must be a comma-separated list of integers")
+    
+    # Fetch all requested polls and their option vote counts in two queries
+    polls = db.query(models.Poll).filter(models.Poll.id.in_(poll_ids)).all()
+    questions = {poll.id: poll.question for poll in polls}
+    
+    results = db.query(
+        models.Option.poll_id,
+        models.Option.id,
+        models.Option.text,
+        func.count(models.Vote.id).label("vote_count")
+    ).outerjoin(models.Vote).filter(
+        models.Option.poll_id.in_(poll_ids)
+    ).group_by(models.Option.id).order_by(models.Option.id).all()
+    
+    # Group the results by poll
+    formatted_results = {poll_id: [] for poll_id in questions}
+    for poll_id, option_id, text, vote_count in results:
+        formatted_results[poll_id].append(
+            {"option_id": option_id, "text": text, "vote_count": vote_count}
+        )
+    
+    return [
+        {"poll_id": poll_id, "question": questions[poll_id], "results": formatted_results[poll_id]}
+        for poll_id in poll_ids
+        if poll_id in questions
+    ]
+
+
 @router.get("/polls/{poll_id}", response_model=schemas.PollOut)
 def get_poll(poll_id: int, db: Session = Depends(get_db)):
     poll = db.query(models.Poll).filter(models.Poll.id == poll_id).first()
@@ -0,0 +1,289 @@
+import asyncio
+import httpx
+from typing import Any, Awaitable, Dict, List, Optional, TypeVar
+
+from httpx_client import MAX_CONNECTIONS, client_session
+from polly_http import AUTH_HEADER_TEMPLATE, BATCH_CHUNK_SIZE, JSON_HEADERS, json_dumps, json_loads
+
+try:
+    import uvloop
+except ImportError:  # not available on Windows
+    uvloop = None
+
+if uvloop is not None and not hasattr(uvloop, "run"):  # uvloop.run() needs 0.18+
+    uvloop = None
+
+T = TypeVar("T")
+
+# Requests kept in flight at once by the bulk helpers. Matching the client's
+# connection pool keeps queued requests from hitting the pool timeout.
+MAX_CONCURRENT_REQUESTS = MAX_CONNECTIONS
+
+
+def run(main: Awaitable[T]) -> T:
+    """
+    Run a coroutine to completion, like asyncio.run().
+
+    Uses uvloop's libuv-based event loop when it is installed, which
+    dispatches requests considerably faster than the default asyncio loop,
+    and falls back to asyncio.run() otherwise.
+    """
+    if uvloop is not None:
+        return uvloop.run(main)
+    return asyncio.run(main)
+
+
+async def _gather_bounded(coros: List[Awaitable[T]], limit: int) -> List[T]:
+    """
+    Like asyncio.gather(), but with at most `limit` awaitables running at once.
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def bounded(coro: Awaitable[T]) -> T:
+        async with semaphore:
+            return await coro
+
+    return await asyncio.gather(*[bounded(coro) for coro in coros])
+
+
+async def fetch_polls_async(client: httpx.AsyncClient, base_url: str, skip: int = 0, limit: int = 10) -> List[Dict]:
+    """
+    Fetch paginated poll data from the /polls endpoint.
+
+    Args:
+        client (httpx.AsyncClient): The client to send the request on
+        base_url (str): The base URL of the API (e.g., 'http://localhost:8000')
+        skip (int): Number of items to skip (default: 0)
+        limit (int): Maximum number of items to return (default: 10)
+
+    Returns:
+        List[Dict]: List of poll objects
+
+    Raises:
+        httpx.HTTPError: If the request fails
+    """
+    url = f"{base_url.rstrip('/')}/polls"
+    params = {
+        "skip": skip,
+        "limit": limit
+    }
+
+    try:
+        response = await client.get(url, params=params)
+        response.raise_for_status()
+        return json_loads(response.content)
+
+    except httpx.HTTPError as e:
+        raise httpx.HTTPError(f"Failed to fetch polls: {e}")
+
+
+async def get_poll_results_async(client: httpx.AsyncClient, base_url: str, poll_id: int) -> Optional[Dict[str, Any]]:
+    """
+    Retrieve poll results from the API.
+
+    Args:
+        client (httpx.AsyncClient): The client to send the request on
+        base_url (str): The base URL of the API (e.g., "http://localhost:8000")
+        poll_id (int): The ID of the poll to get results for
+
+    Returns:
+        Dict containing poll results (see get_poll_results.get_poll_results),
+        or None if an error occurs.
+    """
+    url = f"{base_url.rstrip('/')}/polls/{poll_id}/results"
+
+    try:
+        response = await client.get(url)
+        if response.status_code == 200:
+            return json_loads(response.content)
+        elif response.status_code == 404:
+            print(f"Error: Poll with ID {poll_id} not found")
+            return None
+        else:
+            print(f"Error: Unexpected status code {response.status_code}")
+            print(f"Response: {response.text}")
+            return None
+
+    except httpx.ConnectError:
+        print(f"Error: Could not connect to {base_url}")
+        return None
+    except httpx.TimeoutException:
+        print("Error: Request timed out")
+        return None
+    except httpx.HTTPError as e:
+        print(f"Error: Request failed - {e}")
+        return None
+
+
+async def get_many_poll_results_async(client: httpx.AsyncClient, base_url: str, poll_ids: List[int]) -> List[Optional[Dict[str, Any]]]:
+    """
+    Retrieve results for several polls concurrently, one request per poll.
+
+    Over HTTP/2 the requests are multiplexed on a single connection. At
+    most MAX_CONCURRENT_REQUESTS are in flight at a time. Prefer
+    get_poll_results_batch_async() when the server supports it.
+
+    Args:
+        client (httpx.AsyncClient): The client to send the requests on
+        base_url (str): The base URL of the API
+        poll_ids (List[int]): The IDs of the polls to get results for
+
+    Returns:
+        List of poll results in the same order as poll_ids; entries are None
+        for polls that could not be retrieved.
+    """
+    return await _gather_bounded(
+        [get_poll_results_async(client, base_url, poll_id) for poll_id in poll_ids],
+        MAX_CONCURRENT_REQUESTS
+    )
+
+
+async def _fetch_results_chunk(client: httpx.AsyncClient, url: str, poll_ids: List[int]) -> List[Dict[str, Any]]:
+    response = await client.get(url, params={"ids": ",".join(map(str, poll_ids))})
+    response.raise_for_status()
+    return json_loads(response.content)
+
+
+async def get_poll_results_batch_async(client: httpx.AsyncClient, base_url: str, poll_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+    """
+    Retrieve results for any number of polls using the batch endpoint.
+
+    The IDs are split into chunks of BATCH_CHUNK_SIZE, each fetched with
+    one /polls/results?ids=... request, so tens of thousands of lookups
+    cost only a few hundred requests. The first chunk is fetched alone to
+    check that the server supports the endpoint; if it does not, the polls
+    are looked up individually with get_many_poll_results_async().
+
+    Args:
+        client (httpx.AsyncClient): The client to send the requests on
+        base_url (str): The base URL of the API
+        poll_ids (List[int]): The IDs of the polls to get results for
+
+    Returns:
+        Dict mapping each poll ID to its results. Polls that do not exist
+        are left out.
+
+    Raises:
+        httpx.HTTPError: If a request fails
+    """
+    if not poll_ids:
+        return {}
+
+    url = f"{base_url.rstrip('/')}/polls/results"
+    chunks = [poll_ids[i:i + BATCH_CHUNK_SIZE] for i in range(0, len(poll_ids), BATCH_CHUNK_SIZE)]
+
+    try:
+        try:
+            pages = [await _fetch_results_chunk(client, url, chunks[0])]
+        except httpx.HTTPStatusError as e:
+            # Servers without the batch endpoint route it to /polls/{poll_id}
+            if e.response.status_code not in (404, 405, 422):
+                raise
+            results = await get_many_poll_results_async(client, base_url, poll_ids)
+            return {poll_id: result for poll_id, result in zip(poll_ids, results) if result}
+
+        pages += await _gather_bounded(
+            [_fetch_results_chunk(client, url, chunk) for chunk in chunks[1:]],
+            MAX_CONCURRENT_REQUESTS
+        )
+
+    except httpx.HTTPError as e:
+        raise httpx.HTTPError(f"Failed to fetch poll results: {e}")
+
+    return {result["poll_id"]: result for page in pages for result in page}
+
+
+async def register_user_async(client: httpx.AsyncClient, base_url: str, username: str, password: str) -> Dict:
+    """
+    Register a new user via the /register endpoint.
+
+    Args:
+        client (httpx.AsyncClient): The client to send the request on
+        base_url (str): The base URL of the API (e.g., 'http://localhost:8000')
+        username (str): The username for the new user
+        password (str): The password for the new user
+
+    Returns:
+        Dict: The response from the server containing user information
+
+    Raises:
+        httpx.HTTPError: If the request fails
+        ValueError: If the username is already registered
+    """
+    url = f"{base_url.rstrip('/')}/register"
+    payload = {
+        "username": username,
+        "password": password
+    }
+
+    try:
+        response = await client.post(url, content=json_dumps(payload), headers=JSON_HEADERS)
+        if response.status_code == 200:
+            return json_loads(response.content)
+        elif response.status_code == 400:
+            raise ValueError(f"Registration failed: Username '{username}' already registered")
+        else:
+            response.raise_for_status()
+
+    except httpx.HTTPError as e:
+        raise httpx.HTTPError(f"Failed to register user: {e}")
+
+
+async def vote_on_poll_async(client: httpx.AsyncClient, base_url: str, poll_id: int, option_id: int, access_token: str) -> Dict:
+    """
+    Cast a vote on an existing poll.
+
+    Args:
+        client (httpx.AsyncClient): The client to send the request on
+        base_url (str): The base URL of the API (e.g., 'http://localhost:8000')
+        poll_id (int): The ID of the poll to vote on
+        option_id (int): The ID of the option to vote for
+        access_token (str): JWT access token for authentication
+
+    Returns:
+        Dict: The vote response
+
+    Raises:
+        httpx.HTTPError: If the request fails
+        ValueError: If the token is rejected or the poll/option does not exist
+    """
+    url = f"{base_url.rstrip('/')}/polls/{poll_id}/vote"
+    payload = {
+        "option_id": option_id
+    }
+    headers = {
+        **JSON_HEADERS,
+        "Authorization": AUTH_HEADER_TEMPLATE % access_token
+    }
+
+    try:
+        response = await client.post(url, content=json_dumps(payload), headers=headers)
+        if response.status_code == 200:
+            return json_loads(response.content)
+        elif response.status_code == 401:
+            raise ValueError("Unauthorized: Invalid or expired access token")
+        elif response.status_code == 404:
+            raise ValueError(f"Poll with ID {poll_id} not found or option with ID {option_id} not found")
+        else:
+            response.raise_for_status()
+
+    except httpx.HTTPError as e:
+        raise httpx.HTTPError(f"Failed to cast vote: {e}")
+
+
+# Example usage
+if __name__ == "__main__":
+    BASE_URL = "http://localhost:8000"
+
+    async def main():
+        async with client_session() as client:
+            polls = await fetch_polls_async(client, BASE_URL)
+            print(f"Fetched {len(polls)} polls")
+
+            poll_ids = [poll["id"] for poll in polls]
+            for poll_id, results in zip(poll_ids, await get_many_poll_results_async(client, BASE_URL, poll_ids)):
+                if results:
+                    total_votes = sum(option['vote_count'] for option in results['results'])
+                    print(f"- Poll {poll_id}: {results['question']} ({total_votes} votes)")
+
+    run(main())
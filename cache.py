@@ -0,0 +1,72 @@
+import threading
+import time
+from typing import Any, Dict, Hashable, NamedTuple, Optional
+
+
+class CacheEntry(NamedTuple):
+    expires_at: float
+    value: Any
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+
+class TTLCache:
+    """
+    A small thread-safe in-memory cache whose entries expire after a fixed TTL.
+
+    Expired entries are kept (until evicted) so callers can revalidate them
+    with a conditional request, or fall back to the last known value when
+    the backend is unavailable.
+
+    Args:
+        ttl_seconds (float): How long an entry stays fresh
+        maxsize (int): Maximum number of entries; the oldest entry is evicted
+            first when the cache is full (default: 1024)
+    """
+
+    def __init__(self, ttl_seconds: float, maxsize: int = 1024):
+        self.ttl_seconds = ttl_seconds
+        self.maxsize = maxsize
+        self._entries: Dict[Hashable, CacheEntry] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[CacheEntry]:
+        """
+        Return the entry stored under key, fresh or stale, or None if absent.
+        """
+        with self._lock:
+            return self._entries.get(key)
+
+    def set(self, key: Hashable, value: Any, etag: Optional[str] = None, last_modified: Optional[str] = None) -> None:
+        """
+        Store value under key, fresh for the next ttl_seconds, along with the
+        response validators used to revalidate it once it expires.
+        """
+        entry = CacheEntry(time.monotonic() + self.ttl_seconds, value, etag, last_modified)
+        with self._lock:
+            self._entries.pop(key, None)
+            if len(self._entries) >= self.maxsize:
+                del self._entries[next(iter(self._entries))]
+            self._entries[key] = entry
+
+    def delete(self, key: Hashable) -> None:
+        """
+        Remove the entry stored under key, if any.
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Remove all entries.
+        """
+        with self._lock:
+            self._entries.clear()
+
+
+def is_fresh(entry: Optional[CacheEntry], grace_seconds: float = 0.0) -> bool:
+    """
+    Return True if entry exists and has not expired yet, or expired less
+    than grace_seconds ago.
+    """
+    return entry is not None and entry.expires_at + grace_seconds > time.monotonic()
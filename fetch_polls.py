@@ -1,10 +1,14 @@
 import requests
-from typing import List, Dict, Optional
+from typing import List, Dict, Iterator, Optional
+
+from polly_client import get_client
 
 def fetch_polls(base_url: str, skip: int = 0, limit: int = 10) -> List[Dict]:
     """
     Fetch paginated poll data from the /polls endpoint.
     
+    Delegates to PollyClient.fetch_polls() on the default client for base_url.
+    
     Args:
         base_url (str): The base URL of the API (e.g., 'http://localhost:8000')
         skip (int): Number of items to skip (default: 0)
@@ -20,34 +24,52 @@ def fetch_polls(base_url: str, skip: int = 0, limit: int = 10) -> List[Dict]:
     
     Raises:
         requests.exceptions.RequestException: If the request fails
-        ValueError: If the server returns an error response
     """
-    # Prepare the endpoint URL with query parameters
-    url = f"{base_url.rstrip('/')}/polls"
+    return get_client(base_url).fetch_polls(skip=skip, limit=limit)
+
+def fetch_polls_iter(base_url: str, skip: int = 0, limit: int = 10) -> Iterator[Dict]:
+    """
+    Stream a page of polls from the /polls endpoint, one poll at a time.
     
-    # Prepare query parameters
-    params = {
-        "skip": skip,
-        "limit": limit
-    }
+    Delegates to PollyClient.fetch_polls_iter() on the default client for base_url.
     
-    try:
-        # Make the GET request
-        response = requests.get(url, params=params)
-        
-        # Check if the request was successful
-        if response.status_code == 200:
-            return response.json()
-        else:
-            response.raise_for_status()
-            
-    except requests.exceptions.RequestException as e:
-        raise requests.exceptions.RequestException(f"Failed to fetch polls: {e}")
+    Args:
+        base_url (str): The base URL of the API (e.g., 'http://localhost:8000')
+        skip (int): Number of items to skip (default: 0)
+        limit (int): Maximum number of items to return (default: 10)
+    
+    Yields:
+        Dict: Poll objects, as described in fetch_polls()
+    
+    Raises:
+        requests.exceptions.RequestException: If the request fails
+    """
+    return get_client(base_url).fetch_polls_iter(skip=skip, limit=limit)
+
+def iter_all_polls(base_url: str, page_size: int = 10) -> Iterator[Dict]:
+    """
+    Lazily iterate over all polls, streaming one page at a time.
+    
+    Delegates to PollyClient.iter_all_polls() on the default client for base_url.
+    
+    Args:
+        base_url (str): The base URL of the API
+        page_size (int): Number of items per page (default: 10)
+    
+    Yields:
+        Dict: Poll objects, in server order
+    
+    Raises:
+        requests.exceptions.RequestException: If any request fails
+    """
+    return get_client(base_url).iter_all_polls(page_size=page_size)
 
 def fetch_all_polls(base_url: str, page_size: int = 10) -> List[Dict]:
     """
     Fetch all polls by automatically handling pagination.
     
+    Delegates to PollyClient.fetch_all_polls() on the default client for base_url.
+    
     Args:
         base_url (str): The base URL of the API
         page_size (int): Number of items per page (default: 10)
@@ -58,28 +80,27 @@ def fetch_all_polls(base_url: str, page_size: int = 10) -> List[Dict]:
     Raises:
         requests.exceptions.RequestException: If any request fails
     """
-    all_polls = []
-    skip = 0
+    return get_client(base_url).fetch_all_polls(page_size=page_size)
+
+def fetch_all_polls_concurrent(base_url: str, page_size: int = 50, workers: int = 8) -> List[Dict]:
+    """
+    Fetch all polls by requesting several pages in parallel.
     
-    while True:
-        # Fetch a page of polls
-        polls_page = fetch_polls(base_url, skip=skip, limit=page_size)
-        
-        # If no polls returned, we've reached the end
-        if not polls_page:
-            break
-            
-        # Add polls to our collection
-        all_polls.extend(polls_page)
-        
-        # If we got fewer polls than requested, we've reached the end
-        if len(polls_page) < page_size:
-            break
-            
-        # Move to next page
-        skip += page_size
-    
-    return all_polls
+    Delegates to PollyClient.fetch_all_polls_concurrent() on the default
+    client for base_url.
+    
+    Args:
+        base_url (str): The base URL of the API
+        page_size (int): Number of items per page (default: 50)
+        workers (int): Number of pages to fetch concurrently (default: 8)
+    
+    Returns:
+        List[Dict]: Complete list of all polls, in server order
+    
+    Raises:
+        requests.exceptions.RequestException: If any request fails
+    """
+    return get_client(base_url).fetch_all_polls_concurrent(page_size=page_size, workers=workers)
 
 # Example usage
 if __name__ == "__main__":
@@ -99,5 +120,10 @@ if __name__ == "__main__":
         all_polls = fetch_all_polls("http://localhost:8000")
         print(f"Total polls found: {len(all_polls)}")
         
+        # Fetch all polls, requesting several pages in parallel
+        print("\nFetching all polls concurrently...")
+        all_polls = fetch_all_polls_concurrent("http://localhost:8000")
+        print(f"Total polls found: {len(all_polls)}")
+        
     except requests.exceptions.RequestException as e:
         print(f"Request error: {e}")
\ No newline at end of file
@@ -1,11 +1,20 @@
-import requests
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
+
+from polly_client import get_client
+
+# Polls with at least this many options are aggregated with NumPy; below
+# this, array setup costs more than the vectorized math saves
+NUMPY_MIN_OPTIONS = 128
 
 
 def get_poll_results(base_url: str, poll_id: int) -> Optional[Dict[str, Any]]:
     """
     Retrieve poll results from the API.
     
+    Delegates to PollyClient.get_poll_results() on the default client for
+    base_url. Results are cached briefly, so very recent votes may not be
+    reflected yet.
+    
     Args:
         base_url (str): The base URL of the API (e.g., "http://localhost:8000")
         poll_id (int): The ID of the poll to get results for
@@ -24,40 +33,61 @@ def get_poll_results(base_url: str, poll_id: int) -> Optional[Dict[str, Any]]:
             ]
         }
         Returns None if an error occurs.
+    """
+    return get_client(base_url).get_poll_results(poll_id)
+
+
+def get_poll_results_batch(base_url: str, poll_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+    """
+    Retrieve results for several polls in a single request.
+    
+    Delegates to PollyClient.get_poll_results_batch() on the default client
+    for base_url.
+    
+    Args:
+        base_url (str): The base URL of the API (e.g., "http://localhost:8000")
+        poll_ids (List[int]): The IDs of the polls to get results for
+    
+    Returns:
+        Dict mapping each poll ID to its results (see get_poll_results()).
+        Polls that do not exist are left out.
     
     Raises:
-        requests.RequestException: For network-related errors
+        requests.exceptions.RequestException: If the request fails
+    """
+    return get_client(base_url).get_poll_results_batch(poll_ids)
+
+
+def _unpack_options(options: List[Dict[str, Any]]) -> Tuple[int, List[Tuple[int, str, int]]]:
+    """
+    Unpack each option into an (id, text, votes) tuple, totalling the votes
+    in the same pass.
+    """
+    unpacked = []
+    total_votes = 0
+    for option in options:
+        vote_count = option['vote_count']
+        total_votes += vote_count
+        unpacked.append((option['option_id'], option['text'], vote_count))
+    return total_votes, unpacked
+
+
+def _vote_percentages_numpy(options: List[Dict[str, Any]]) -> Optional[Tuple[int, List[float]]]:
+    """
+    Return the total vote count and each option's share of it in percent,
+    computed with NumPy for polls with many options. Returns None if NumPy
+    is not installed.
     """
     try:
-        # Construct the URL
-        url = f"{base_url.rstrip('/')}/polls/{poll_id}/results"
-        
-        # Make the GET request
-        response = requests.get(url)
-        
-        # Handle different response status codes
-        if response.status_code == 200:
-            return response.json()
-        elif response.status_code == 404:
-            print(f"Error: Poll with ID {poll_id} not found")
-            return None
-        else:
-            print(f"Error: Unexpected status code {response.status_code}")
-            print(f"Response: {response.text}")
-            return None
-            
-    except requests.exceptions.ConnectionError:
-        print(f"Error: Could not connect to {base_url}")
-        return None
-    except requests.exceptions.Timeout:
-        print("Error: Request timed out")
-        return None
-    except requests.exceptions.RequestException as e:
-        print(f"Error: Request failed - {e}")
-        return None
-    except Exception as e:
-        print(f"Unexpected error: {e}")
+        import numpy as np
+    except ImportError:
         return None
+    
+    votes = np.fromiter((option['vote_count'] for option in options), dtype=np.int64, count=len(options))
+    total_votes = int(votes.sum())
+    if total_votes == 0:
+        return 0, [0.0] * len(options)
+    return total_votes, (votes / total_votes * 100).tolist()
 
 
 def display_poll_results(results: Dict[str, Any]) -> None:
@@ -71,22 +101,37 @@ def display_poll_results(results: Dict[str, Any]) -> None:
         print("No results to display")
         return
     
-    print(f"\nPoll Results for Poll ID: {results['poll_id']}")
-    print(f"Question: {results['question']}")
-    print("\nResults:")
-    print("-" * 50)
+    options = results['results']
+    vectorized = _vote_percentages_numpy(options) if len(options) >= NUMPY_MIN_OPTIONS else None
     
-    total_votes = sum(option['vote_count'] for option in results['results'])
+    if vectorized is not None:
+        total_votes, percentages = vectorized
+        rows = (
+            (option['option_id'], option['text'], option['vote_count'], percentage)
+            for option, percentage in zip(options, percentages)
+        )
+    else:
+        # Unpack and total in one pass; percentages are computed while formatting
+        total_votes, unpacked = _unpack_options(options)
+        rows = (
+            (option_id, text, vote_count, (vote_count / total_votes * 100) if total_votes > 0 else 0)
+            for option_id, text, vote_count in unpacked
+        )
     
-    for option in results['results']:
-        vote_count = option['vote_count']
-        percentage = (vote_count / total_votes * 100) if total_votes > 0 else 0
-        
-        print(f"Option {option['option_id']}: {option['text']}")
-        print(f"  Votes: {vote_count} ({percentage:.1f}%)")
-        print()
+    lines = [
+        f"\nPoll Results for Poll ID: {results['poll_id']}",
+        f"Question: {results['question']}",
+        "\nResults:",
+        "-" * 50
+    ]
+    for option_id, text, vote_count, percentage in rows:
+        lines.append(f"Option {option_id}: {text}")
+        lines.append(f"  Votes: {vote_count} ({percentage:.1f}%)")
+        lines.append("")
+    lines.append(f"Total votes: {total_votes}")
     
-    print(f"Total votes: {total_votes}")
+    # Write everything with a single print call
+    print("\n".join(lines))
 
 
 # Example usage
@@ -104,13 +149,15 @@ if __name__ == "__main__":
     else:
         print("Failed to retrieve poll results")
     
-    # Example of checking multiple polls
+    # Example of checking multiple polls in one request
     print("\n" + "="*60)
     print("Checking multiple polls:")
     
-    for poll_id in [1, 2, 3]:
+    poll_ids = [1, 2, 3]
+    batch_results = get_poll_results_batch(BASE_URL, poll_ids)
+    for poll_id in poll_ids:
         print(f"\nChecking poll {poll_id}:")
-        results = get_poll_results(BASE_URL, poll_id)
+        results = batch_results.get(poll_id)
         if results:
             total_votes = sum(option['vote_count'] for option in results['results'])
             print(f"  Question: {results['question']}")
@@ -0,0 +1,41 @@
+import httpx
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+# Connection pool limits for the shared AsyncClient
+MAX_CONNECTIONS = 20
+MAX_KEEPALIVE_CONNECTIONS = 20
+
+
+def make_client() -> httpx.AsyncClient:
+    """
+    Create an AsyncClient that negotiates HTTP/2 where the server supports it.
+
+    Over HTTP/2 many concurrent requests are multiplexed as streams on one
+    connection instead of queueing behind each other. HTTP/2 is negotiated
+    via TLS ALPN, so plain http:// URLs (and servers without h2 support,
+    such as uvicorn) transparently use HTTP/1.1 with keep-alive.
+
+    Returns:
+        httpx.AsyncClient: A new client; close it with `await client.aclose()`
+    """
+    limits = httpx.Limits(max_connections=MAX_CONNECTIONS, max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS)
+    return httpx.AsyncClient(http2=True, limits=limits)
+
+
+@asynccontextmanager
+async def client_session() -> AsyncIterator[httpx.AsyncClient]:
+    """
+    Provide an AsyncClient for the duration of a block and close it after.
+
+    Create one per event loop run and pass it to every call in that run so
+    all requests share its connections:
+
+        async with client_session() as client:
+            ...
+    """
+    client = make_client()
+    try:
+        yield client
+    finally:
+        await client.aclose()
@@ -1,10 +1,14 @@
 from fastapi import FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
 from api.database import Base, engine
 from api import models
+from api.etag import ETagMiddleware
 from api.routes import router
 
 # Create tables
 Base.metadata.create_all(bind=engine)
 
 app = FastAPI()
+app.add_middleware(ETagMiddleware)
+app.add_middleware(GZipMiddleware, minimum_size=500)
 app.include_router(router)
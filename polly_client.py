@@ -0,0 +1,707 @@
+import base64
+import functools
+import hashlib
+import hmac
+import ijson
+import requests
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, NoReturn, Optional, Tuple
+
+from cache import TTLCache
+from polly_http import AUTH_HEADER_TEMPLATE, BATCH_CHUNK_SIZE, JSON_HEADERS, cache_key, conditional_get, get_session, idempotency_headers, json_dumps, json_loads
+
+# How long a fetched page of polls is served from cache
+POLLS_TTL_SECONDS = 30
+
+# How long poll results are served from cache
+RESULTS_TTL_SECONDS = 10
+
+# Cached access tokens are refreshed this long before they expire
+TOKEN_REFRESH_MARGIN_SECONDS = 30
+
+# Threads used by get_poll_results_batch() to send requests concurrently
+RESULTS_WORKERS = 8
+
+# Timeout for the background warm-up request sent by PollyClient.preconnect()
+PRECONNECT_TIMEOUT_SECONDS = 2
+
+
+class UnauthorizedError(ValueError):
+    """
+    Raised when the API rejects an access token (HTTP 401).
+    """
+
+
+class CachedToken(NamedTuple):
+    token: str
+    expires_at: float
+    password_digest: bytes
+    claims: Dict[str, Any]
+
+
+# Access tokens from login_and_vote(), keyed by (base URL, username). Guarded
+# by a lock so concurrent logins stay consistent without the GIL.
+_TOKEN_CACHE: Dict[Tuple[str, str], CachedToken] = {}
+_TOKEN_CACHE_LOCK = threading.Lock()
+
+
+def _password_digest(password: str) -> bytes:
+    return hashlib.sha256(password.encode()).digest()
+
+
+def _decode_claims(token: str) -> Dict[str, Any]:
+    """
+    Return the claims of a JWT, or an empty dict if they cannot be read.
+    The signature is not verified; the claims are only used client-side,
+    e.g. to decide when to log in again.
+    """
+    try:
+        payload = token.split(".")[1]
+        claims = json_loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+    except (IndexError, TypeError, ValueError):
+        return {}
+    return claims if isinstance(claims, dict) else {}
+
+
+def _cache_token(cache_key: Tuple[str, str], token: str, password: str) -> CachedToken:
+    """
+    Decode a freshly issued token once and store it in _TOKEN_CACHE.
+    """
+    claims = _decode_claims(token)
+    try:
+        expires_at = float(claims["exp"])
+    except (KeyError, TypeError, ValueError):
+        expires_at = 0.0
+    cached = CachedToken(token, expires_at, _password_digest(password), claims)
+    with _TOKEN_CACHE_LOCK:
+        _TOKEN_CACHE[cache_key] = cached
+    return cached
+
+
+# Status code handlers for get_poll_results() and vote_on_poll(). Looking the
+# status up in a dict keeps the 200 path free of error-branch checks, and
+# error messages are only formatted when an error actually occurs. Statuses
+# without an entry, including 5xx responses once the session's retries are
+# used up, go to the default handler.
+
+def _report_poll_not_found(response: requests.Response, poll_id: int) -> None:
+    print(f"Error: Poll with ID {poll_id} not found")
+
+
+def _report_unexpected_status(response: requests.Response, poll_id: int) -> None:
+    print(f"Error: Unexpected status code {response.status_code}")
+    print(f"Response: {response.text}")
+
+
+_RESULTS_ERROR_HANDLERS: Dict[int, Callable[[requests.Response, int], None]] = {
+    404: _report_poll_not_found
+}
+
+
+def _vote_cast(response: requests.Response, poll_id: int, option_id: int) -> Dict:
+    return json_loads(response.content)
+
+
+def _raise_vote_unauthorized(response: requests.Response, poll_id: int, option_id: int) -> NoReturn:
+    raise UnauthorizedError("Unauthorized: Invalid or expired access token")
+
+
+def _raise_vote_not_found(response: requests.Response, poll_id: int, option_id: int) -> NoReturn:
+    raise ValueError(f"Poll with ID {poll_id} not found or option with ID {option_id} not found")
+
+
+def _raise_vote_status(response: requests.Response, poll_id: int, option_id: int) -> Optional[Dict]:
+    # Raises for 4xx/5xx; any other unexpected status yields None
+    response.raise_for_status()
+    return None
+
+
+_VOTE_HANDLERS: Dict[int, Callable[[requests.Response, int, int], Optional[Dict]]] = {
+    200: _vote_cast,
+    401: _raise_vote_unauthorized,
+    404: _raise_vote_not_found
+}
+
+
+class PollyClient:
+    """
+    Client for the Polly API bound to a single base URL.
+
+    Endpoint URLs are built once when the client is created rather than on
+    every call. All requests go through a shared pooled requests.Session.
+
+    Args:
+        base_url (str): The base URL of the API (e.g., 'http://localhost:8000')
+        session (requests.Session): Session to send requests on (default:
+            the shared session from polly_http.get_session(), looked up on
+            every request so a new one is used after close_session())
+        preconnect (bool): Open a connection to the API in the background
+            right away, see preconnect() (default: True)
+        stale_if_error (float): When the API cannot be reached, keep serving
+            cached polls and results for up to this many seconds past their
+            expiry instead of raising (default: 0, never serve stale data)
+    """
+
+    def __init__(self, base_url: str, session: Optional[requests.Session] = None, preconnect: bool = True, stale_if_error: float = 0.0):
+        self._base = base_url.rstrip('/')
+        self._polls_url = f"{self._base}/polls"
+        self._batch_results_url = f"{self._polls_url}/results"
+        self._register_url = f"{self._base}/register"
+        self._login_url = f"{self._base}/login"
+        self._own_session = session
+
+        self._polls_cache = TTLCache(POLLS_TTL_SECONDS)
+        self._results_cache = TTLCache(RESULTS_TTL_SECONDS)
+        self._batch_results_cache = TTLCache(RESULTS_TTL_SECONDS)
+        self._stale_if_error = stale_if_error
+
+        self._warm_up_thread: Optional[threading.Thread] = None
+        if preconnect:
+            self.preconnect()
+
+    @property
+    def base_url(self) -> str:
+        return self._base
+
+    @property
+    def _session(self) -> requests.Session:
+        warm_up = self._warm_up_thread
+        if warm_up is not None:
+            # Let the first request reuse the connection the warm-up opens
+            # rather than racing it with a second one
+            warm_up.join(PRECONNECT_TIMEOUT_SECONDS)
+            self._warm_up_thread = None
+        return self._current_session()
+
+    def _current_session(self) -> requests.Session:
+        if self._own_session is not None:
+            return self._own_session
+        return get_session()
+
+    def preconnect(self) -> None:
+        """
+        Establish a pooled connection to the API in a background thread.
+
+        Sends a cheap request for an empty page of polls so the TCP (and
+        TLS) handshake happens while the caller is still setting up. Returns
+        immediately; the first real request waits for the warm-up to finish
+        (at most PRECONNECT_TIMEOUT_SECONDS) and then reuses its connection.
+        Any error is ignored since that request will simply connect itself.
+        """
+        thread = threading.Thread(target=self._warm_up, daemon=True)
+        self._warm_up_thread = thread
+        thread.start()
+
+    def _warm_up(self) -> None:
+        try:
+            self._current_session().get(self._polls_url, params={"limit": 0}, timeout=PRECONNECT_TIMEOUT_SECONDS)
+        except requests.exceptions.RequestException:
+            pass
+
+    def fetch_polls(self, skip: int = 0, limit: int = 10) -> List[Dict]:
+        """
+        Fetch paginated poll data from the /polls endpoint.
+
+        Pages are cached for POLLS_TTL_SECONDS and then revalidated with a
+        conditional request, so unchanged pages are not downloaded again. If
+        the client was created with stale_if_error and the API is
+        unreachable, the last page fetched for the same arguments is returned
+        instead, provided it expired no longer than stale_if_error ago.
+
+        Args:
+            skip (int): Number of items to skip (default: 0)
+            limit (int): Maximum number of items to return (default: 10)
+
+        Returns:
+            List[Dict]: List of poll objects, each containing:
+                - id (int): Poll ID
+                - question (str): Poll question
+                - created_at (str): Creation timestamp in ISO format
+                - owner_id (int): ID of the poll owner
+                - options (List[Dict]): List of poll options with id, text, and poll_id
+
+        Raises:
+            requests.exceptions.RequestException: If the request fails
+        """
+        params = {
+            "skip": skip,
+            "limit": limit
+        }
+
+        try:
+            return conditional_get(self._session, self._polls_url, self._polls_cache, params=params, stale_if_error=self._stale_if_error)
+
+        except requests.exceptions.RequestException as e:
+            raise requests.exceptions.RequestException(f"Failed to fetch polls: {e}")
+
+    def fetch_polls_iter(self, skip: int = 0, limit: int = 10) -> Iterator[Dict]:
+        """
+        Stream a page of polls from the /polls endpoint, one poll at a time.
+
+        The response body is parsed incrementally as it arrives, so only the
+        poll being yielded is held in memory. Streamed pages bypass the cache
+        used by fetch_polls().
+
+        Args:
+            skip (int): Number of items to skip (default: 0)
+            limit (int): Maximum number of items to return (default: 10)
+
+        Yields:
+            Dict: Poll objects, as described in fetch_polls()
+
+        Raises:
+            requests.exceptions.RequestException: If the request fails
+        """
+        params = {
+            "skip": skip,
+            "limit": limit
+        }
+
+        try:
+            with self._session.get(self._polls_url, params=params, stream=True) as response:
+                response.raise_for_status()
+
+                # Let urllib3 undo any Content-Encoding before ijson reads the body
+                response.raw.decode_content = True
+                yield from ijson.items(response.raw, "item")
+
+        except requests.exceptions.RequestException as e:
+            raise requests.exceptions.RequestException(f"Failed to fetch polls: {e}")
+
+    def iter_all_polls(self, page_size: int = 10) -> Iterator[Dict]:
+        """
+        Lazily iterate over all polls, streaming one page at a time.
+
+        Unlike fetch_all_polls(), polls are never collected into a list, so
+        memory use stays flat regardless of how many polls exist.
+
+        Args:
+            page_size (int): Number of items per page (default: 10)
+
+        Yields:
+            Dict: Poll objects, in server order
+
+        Raises:
+            requests.exceptions.RequestException: If any request fails
+        """
+        skip = 0
+
+        while True:
+            count = 0
+            for poll in self.fetch_polls_iter(skip=skip, limit=page_size):
+                count += 1
+                yield poll
+
+            # An empty or short page means we've reached the end
+            if count == 0 or count < page_size:
+                break
+
+            skip += page_size
+
+    def fetch_all_polls(self, page_size: int = 10) -> List[Dict]:
+        """
+        Fetch all polls by automatically handling pagination.
+
+        Use iter_all_polls() instead to process polls without materializing
+        the full list.
+
+        Args:
+            page_size (int): Number of items per page (default: 10)
+
+        Returns:
+            List[Dict]: Complete list of all polls
+
+        Raises:
+            requests.exceptions.RequestException: If any request fails
+        """
+        all_polls = []
+        skip = 0
+
+        while True:
+            # Fetch a page of polls
+            polls_page = self.fetch_polls(skip=skip, limit=page_size)
+
+            # If no polls returned, we've reached the end
+            if not polls_page:
+                break
+
+            # Add polls to our collection
+            all_polls.extend(polls_page)
+
+            # If we got fewer polls than requested, we've reached the end
+            if len(polls_page) < page_size:
+                break
+
+            # Move to next page
+            skip += page_size
+
+        return all_polls
+
+    def fetch_all_polls_concurrent(self, page_size: int = 50, workers: int = 8) -> List[Dict]:
+        """
+        Fetch all polls by requesting several pages in parallel.
+
+        The first page is fetched on its own to probe whether more pages
+        exist. Subsequent pages are then requested in batches of `workers`
+        pages at a time over the shared session, until a page comes back
+        short.
+
+        Args:
+            page_size (int): Number of items per page (default: 50)
+            workers (int): Number of pages to fetch concurrently (default: 8)
+
+        Returns:
+            List[Dict]: Complete list of all polls, in server order
+
+        Raises:
+            requests.exceptions.RequestException: If any request fails
+            ValueError: If page_size or workers is less than 1
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+
+        # Probe the first page
+        all_polls = self.fetch_polls(skip=0, limit=page_size)
+        if len(all_polls) < page_size:
+            return all_polls
+
+        next_page = 1
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            while True:
+                # Schedule the next batch of pages
+                futures = [
+                    executor.submit(self.fetch_polls, skip=page * page_size, limit=page_size)
+                    for page in range(next_page, next_page + workers)
+                ]
+                next_page += workers
+
+                # Collect results in skip order, stopping at the first short page
+                for future in futures:
+                    polls_page = future.result()
+                    if not polls_page:
+                        return all_polls
+
+                    all_polls.extend(polls_page)
+
+                    if len(polls_page) < page_size:
+                        return all_polls
+
+    def get_poll_results(self, poll_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Retrieve poll results from the API.
+
+        Successful results are cached for RESULTS_TTL_SECONDS, so votes cast
+        by other clients in the meantime may not be reflected until the entry
+        expires; votes cast through this client drop the cached entry. Expired
+        entries are revalidated with a conditional request. Stale results are
+        only returned on connection errors, and only within the client's
+        stale_if_error window.
+
+        Args:
+            poll_id (int): The ID of the poll to get results for
+
+        Returns:
+            Dict containing poll results with structure:
+            {
+                "poll_id": int,
+                "question": str,
+                "results": [
+                    {
+                        "option_id": int,
+                        "text": str,
+                        "vote_count": int
+                    }
+                ]
+            }
+            Returns None if an error occurs.
+        """
+        try:
+            return conditional_get(self._session, self._results_url(poll_id), self._results_cache, stale_if_error=self._stale_if_error)
+
+        except requests.exceptions.HTTPError as e:
+            # Handle error status codes
+            _RESULTS_ERROR_HANDLERS.get(e.response.status_code, _report_unexpected_status)(e.response, poll_id)
+            return None
+        except requests.exceptions.ConnectionError:
+            print(f"Error: Could not connect to {self._base}")
+            return None
+        except requests.exceptions.Timeout:
+            print("Error: Request timed out")
+            return None
+        except requests.exceptions.RequestException as e:
+            print(f"Error: Request failed - {e}")
+            return None
+        except Exception as e:
+            print(f"Unexpected error: {e}")
+            return None
+
+    def get_poll_results_batch(self, poll_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """
+        Retrieve results for several polls in as few requests as possible.
+
+        Uses the /polls/results?ids=... endpoint, with the IDs split into
+        chunks of BATCH_CHUNK_SIZE. The first chunk is fetched alone to check
+        that the server supports the endpoint; the remaining chunks are then
+        fetched concurrently from a thread pool. If the server does not
+        provide the endpoint, the polls are looked up individually and
+        concurrently instead.
+
+        Args:
+            poll_ids (List[int]): The IDs of the polls to get results for
+
+        Returns:
+            Dict mapping each poll ID to its results (see get_poll_results()).
+            Polls that do not exist are left out.
+
+        Raises:
+            requests.exceptions.RequestException: If the request fails
+        """
+        if not poll_ids:
+            return {}
+
+        chunks = [poll_ids[i:i + BATCH_CHUNK_SIZE] for i in range(0, len(poll_ids), BATCH_CHUNK_SIZE)]
+
+        try:
+            pages = [self._fetch_results_chunk(chunks[0])]
+        except requests.exceptions.HTTPError as e:
+            # Servers without the batch endpoint route it to /polls/{poll_id}
+            if e.response.status_code not in (404, 405, 422):
+                raise
+            return self._get_poll_results_individually(poll_ids)
+
+        if len(chunks) > 1:
+            with ThreadPoolExecutor(max_workers=min(RESULTS_WORKERS, len(chunks) - 1)) as executor:
+                pages.extend(executor.map(self._fetch_results_chunk, chunks[1:]))
+
+        return {result["poll_id"]: result for page in pages for result in page}
+
+    def _fetch_results_chunk(self, poll_ids: List[int]) -> List[Dict[str, Any]]:
+        """
+        Fetch one chunk of get_poll_results_batch() with a single request.
+        """
+        params = {
+            "ids": ",".join(map(str, poll_ids))
+        }
+        return conditional_get(self._session, self._batch_results_url, self._batch_results_cache, params=params, stale_if_error=self._stale_if_error)
+
+    def _get_poll_results_individually(self, poll_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """
+        Fallback for get_poll_results_batch(): one request per poll, sent
+        concurrently from a thread pool over the shared session.
+        """
+        with ThreadPoolExecutor(max_workers=min(RESULTS_WORKERS, len(poll_ids))) as executor:
+            results = executor.map(self.get_poll_results, poll_ids)
+            return {poll_id: result for poll_id, result in zip(poll_ids, results) if result}
+
+    def _results_url(self, poll_id: int) -> str:
+        return f"{self._polls_url}/{poll_id}/results"
+
+    def _forget_results(self, poll_id: int) -> None:
+        """
+        Drop cached results that a vote on poll_id has made outdated, so
+        the caller's next lookup sees its own vote.
+        """
+        self._results_cache.delete(cache_key(self._results_url(poll_id)))
+        # Batch entries are keyed by their whole ID list; drop them all
+        self._batch_results_cache.clear()
+
+    def register_user(self, username: str, password: str) -> Dict:
+        """
+        Register a new user via the /register endpoint.
+
+        Args:
+            username (str): The username for the new user
+            password (str): The password for the new user
+
+        Returns:
+            Dict: The response from the server containing user information
+
+        Raises:
+            requests.exceptions.RequestException: If the request fails
+            ValueError: If the username is already registered
+        """
+        payload = {
+            "username": username,
+            "password": password
+        }
+
+        try:
+            response = self._session.post(self._register_url, data=json_dumps(payload), headers=idempotency_headers(JSON_HEADERS))
+
+            if response.status_code == 200:
+                return json_loads(response.content)
+            elif response.status_code == 400:
+                raise ValueError(f"Registration failed: Username '{username}' already registered")
+            else:
+                response.raise_for_status()
+
+        except requests.exceptions.RequestException as e:
+            raise requests.exceptions.RequestException(f"Failed to register user: {e}")
+
+    def login(self, username: str, password: str) -> str:
+        """
+        Log in via the /login endpoint.
+
+        Args:
+            username (str): Username for authentication
+            password (str): Password for authentication
+
+        Returns:
+            str: JWT access token
+
+        Raises:
+            requests.exceptions.RequestException: If the request fails
+            ValueError: If the credentials are rejected
+        """
+        login_data = {
+            "username": username,
+            "password": password
+        }
+
+        try:
+            # requests form-encodes a dict body and sets its Content-Type
+            login_response = self._session.post(self._login_url, data=login_data)
+
+            if login_response.status_code == 200:
+                return json_loads(login_response.content)["access_token"]
+            elif login_response.status_code == 400:
+                raise ValueError("Login failed: Incorrect username or password")
+            else:
+                login_response.raise_for_status()
+
+        except requests.exceptions.RequestException as e:
+            raise requests.exceptions.RequestException(f"Failed to log in: {e}")
+
+    def vote_on_poll(self, poll_id: int, option_id: int, access_token: str) -> Dict:
+        """
+        Cast a vote on an existing poll.
+
+        Args:
+            poll_id (int): The ID of the poll to vote on
+            option_id (int): The ID of the option to vote for
+            access_token (str): JWT access token for authentication
+
+        Returns:
+            Dict: The vote response containing:
+                - id (int): Vote ID
+                - user_id (int): ID of the user who voted
+                - option_id (int): ID of the selected option
+                - created_at (str): Vote timestamp in ISO format
+
+        Raises:
+            requests.exceptions.RequestException: If the request fails
+            UnauthorizedError: If the access token is rejected
+            ValueError: If the server returns an error response
+        """
+        payload = {
+            "option_id": option_id
+        }
+        headers = idempotency_headers(JSON_HEADERS)
+        headers["Authorization"] = AUTH_HEADER_TEMPLATE % access_token
+
+        try:
+            response = self._session.post(f"{self._polls_url}/{poll_id}/vote", data=json_dumps(payload), headers=headers)
+
+            vote = _VOTE_HANDLERS.get(response.status_code, _raise_vote_status)(response, poll_id, option_id)
+            if response.status_code == 200:
+                self._forget_results(poll_id)
+            return vote
+
+        except requests.exceptions.RequestException as e:
+            raise requests.exceptions.RequestException(f"Failed to cast vote: {e}")
+
+    def login_and_vote(self, username: str, password: str, poll_id: int, option_id: int) -> Dict:
+        """
+        Log in a user and cast a vote in one operation.
+
+        The access token is cached per (base URL, username) and reused until
+        TOKEN_REFRESH_MARGIN_SECONDS before it expires, so repeated votes
+        skip the login request. If a cached token is rejected, it is dropped
+        and the vote is retried once with a fresh login.
+
+        Args:
+            username (str): Username for authentication
+            password (str): Password for authentication
+            poll_id (int): The ID of the poll to vote on
+            option_id (int): The ID of the option to vote for
+
+        Returns:
+            Dict: The vote response
+
+        Raises:
+            requests.exceptions.RequestException: If any request fails
+            ValueError: If login fails or voting fails
+        """
+        cache_key = (self._base, username)
+
+        try:
+            access_token = self._cached_token(cache_key, password)
+            if access_token is not None:
+                try:
+                    return self.vote_on_poll(poll_id, option_id, access_token)
+                except UnauthorizedError:
+                    with _TOKEN_CACHE_LOCK:
+                        _TOKEN_CACHE.pop(cache_key, None)
+
+            access_token = self.login(username, password)
+            _cache_token(cache_key, access_token, password)
+            return self.vote_on_poll(poll_id, option_id, access_token)
+
+        except requests.exceptions.RequestException as e:
+            raise requests.exceptions.RequestException(f"Failed to login and vote: {e}")
+
+    def get_token_claims(self, username: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the decoded claims of the token cached for username by
+        login_and_vote(), without sending a request.
+
+        The claims are decoded once when the token is issued. The API's
+        tokens carry the username as `sub` and the expiry as `exp`.
+
+        Args:
+            username (str): The user whose token to inspect
+
+        Returns:
+            Dict of JWT claims, or None if no unexpired token is cached
+        """
+        with _TOKEN_CACHE_LOCK:
+            cached = _TOKEN_CACHE.get((self._base, username))
+        if cached is None or cached.expires_at <= time.time():
+            return None
+        return cached.claims
+
+    def _cached_token(self, cache_key: Tuple[str, str], password: str) -> Optional[str]:
+        """
+        Return the cached token for cache_key if it was issued for the same
+        password and is not about to expire.
+        """
+        with _TOKEN_CACHE_LOCK:
+            cached = _TOKEN_CACHE.get(cache_key)
+        if cached is None or not hmac.compare_digest(cached.password_digest, _password_digest(password)):
+            return None
+        if cached.expires_at - TOKEN_REFRESH_MARGIN_SECONDS <= time.time():
+            return None
+        return cached.token
+
+
+def get_client(base_url: str) -> PollyClient:
+    """
+    Return the default PollyClient for base_url, creating it on first use.
+
+    The module-level functions in fetch_polls, get_poll_results,
+    register_user and vote_on_poll delegate to these clients. They are
+    created right before their first request, so they skip the background
+    preconnect, which would only open a second connection. URLs that differ
+    only by a trailing slash share one client.
+    """
+    return _default_client(base_url.rstrip('/'))
+
+
+@functools.lru_cache(maxsize=None)
+def _default_client(base_url: str) -> PollyClient:
+    return PollyClient(base_url, preconnect=False)
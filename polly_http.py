@@ -0,0 +1,250 @@
+import orjson
+import requests
+import sys
+import threading
+import uuid
+from requests.adapters import HTTPAdapter
+from typing import Any, Dict, FrozenSet, Optional, Tuple, Union
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+
+from cache import TTLCache, is_fresh
+
+# Connection pool sizing for the shared session
+POOL_CONNECTIONS = 10
+POOL_MAXSIZE = 100
+
+# Status codes on which a POST is retried, provided the response carries a
+# Retry-After header: the server turned the request away without acting on it
+POST_RETRY_STATUSES = frozenset([429, 503])
+
+
+class _RetryPolicy(Retry):
+    """
+    Retry that only replays a POST when it cannot have been processed.
+
+    The API does not deduplicate requests, so replaying a POST after a 5xx
+    or a read error could apply it twice (e.g. a registration that did
+    succeed would come back as "already registered"). POSTs are retried on
+    connection errors, which urllib3 retries for every method, and on
+    POST_RETRY_STATUSES with a Retry-After header.
+    """
+
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        if method.upper() == "POST":
+            return self.respect_retry_after_header and has_retry_after and status_code in POST_RETRY_STATUSES
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+# Transient failures are retried with exponential backoff plus random jitter.
+# When the status retries run out, the last response is returned so callers
+# handle it like any other error status.
+RETRY_POLICY = _RetryPolicy(
+    total=5,
+    backoff_factor=0.3,
+    backoff_jitter=0.1,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=frozenset(["GET"]),
+    respect_retry_after_header=True,
+    raise_on_status=False
+)
+
+# Headers for JSON request bodies. Bodies are pre-encoded with json_dumps()
+# and sent as raw bytes, so requests does not add a Content-Type itself.
+JSON_HEADERS = {
+    "Content-Type": "application/json"
+}
+
+# Authorization header value for a bearer token
+AUTH_HEADER_TEMPLATE = "Bearer %s"
+
+# Poll IDs per /polls/results request, which keeps the query string short
+BATCH_CHUNK_SIZE = 200
+
+_SESSION: Optional[requests.Session] = None
+_SESSION_LOCK = threading.Lock()
+
+
+def gil_enabled() -> bool:
+    """
+    Return False when running on a free-threaded build (python3.13t) with
+    the GIL currently disabled.
+
+    Checked on every call, since importing an extension module without
+    free-threading support turns the GIL back on at any point.
+    """
+    if hasattr(sys, "_is_gil_enabled"):
+        return sys._is_gil_enabled()
+    return True
+
+
+def json_loads(data: Union[bytes, str]) -> Any:
+    """
+    Decode a JSON document. All client modules parse responses through this
+    helper so the JSON backend can be swapped in one place.
+    """
+    return orjson.loads(data)
+
+
+def json_dumps(obj: Any) -> bytes:
+    """
+    Encode obj as a UTF-8 JSON document for use as a request body.
+    """
+    return orjson.dumps(obj)
+
+
+def _build_session() -> requests.Session:
+    """
+    Create a requests.Session with a pooled, retrying adapter mounted on
+    both http:// and https:// so connections are kept alive between calls,
+    and with compressed responses enabled.
+    """
+    adapter = HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=RETRY_POLICY
+    )
+
+    session = requests.Session()
+
+    # Ask for every content coding urllib3 can decode here (gzip and deflate,
+    # plus br/zstd when their decoders are installed); bodies are
+    # decompressed transparently, including on streamed responses.
+    session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def idempotency_headers(headers: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+    """
+    Return headers carrying a fresh Idempotency-Key for one logical request.
+
+    The same key is sent on every automatic retry of that request, since
+    urllib3 replays the original headers, so a server that supports the
+    header can recognise replays.
+
+    Args:
+        headers (Dict): Optional headers to copy into the result, so a
+            request's headers are built with a single dict
+
+    Returns:
+        Dict[str, str]: A new dict the caller may add further headers to
+    """
+    result = dict(headers) if headers else {}
+    result["Idempotency-Key"] = str(uuid.uuid4())
+    return result
+
+
+def get_session() -> requests.Session:
+    """
+    Return the shared session used by the API client scripts.
+
+    The session is created on first use and reused afterwards, so repeated
+    calls to the same host reuse an open TCP/TLS connection. The lock only
+    covers creating it; concurrent requests rely on urllib3's thread-safe
+    connection pool, and the session's own state is not modified after
+    _build_session().
+
+    Returns:
+        requests.Session: The shared session
+    """
+    global _SESSION
+    session = _SESSION
+    if session is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                _SESSION = _build_session()
+            session = _SESSION
+    return session
+
+
+def close_session() -> None:
+    """
+    Close the shared session and release its pooled connections.
+
+    A new session is created transparently on the next call to get_session().
+    """
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is not None:
+            _SESSION.close()
+            _SESSION = None
+
+
+def cache_key(url: str, params: Optional[Dict[str, Any]] = None) -> Tuple[str, Optional[FrozenSet]]:
+    """
+    Return the key conditional_get() stores the response for url and params
+    under, e.g. to drop it from the cache after a write.
+    """
+    return (url, frozenset(params.items()) if params else None)
+
+
+def conditional_get(session: requests.Session, url: str, cache: TTLCache, params: Optional[Dict[str, Any]] = None, stale_if_error: float = 0.0) -> Any:
+    """
+    GET a JSON resource through a TTL cache, revalidating expired entries.
+
+    A fresh cache entry is returned without touching the network. Once it
+    expires, the request carries If-None-Match / If-Modified-Since from the
+    cached response; a 304 reply renews the entry without a body download.
+    If the server cannot be reached and stale_if_error is set, an entry that
+    expired at most that many seconds ago is returned instead of raising.
+
+    The cache holds the raw response body, which is decoded on every call,
+    so each caller gets its own objects and may modify them freely.
+
+    Args:
+        session (requests.Session): The session to send the request on
+        url (str): The URL to fetch
+        cache (TTLCache): The cache holding responses for this endpoint
+        params (Dict): Optional query parameters
+        stale_if_error (float): How long past expiry a cached value may still
+            be served when the request fails (default: 0, never)
+
+    Returns:
+        The decoded JSON body
+
+    Raises:
+        requests.exceptions.HTTPError: If the server returns an error status
+        requests.exceptions.RequestException: If the request fails and no
+            cached value within stale_if_error is available
+    """
+    key = cache_key(url, params)
+    entry = cache.get(key)
+    if is_fresh(entry):
+        return json_loads(entry.value)
+
+    headers = {}
+    if entry is not None:
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+
+    try:
+        response = session.get(url, params=params, headers=headers)
+    except requests.exceptions.RequestException:
+        if stale_if_error > 0 and is_fresh(entry, stale_if_error):
+            return json_loads(entry.value)
+        raise
+
+    if response.status_code == 304 and entry is not None:
+        cache.set(
+            key,
+            entry.value,
+            etag=response.headers.get("ETag", entry.etag),
+            last_modified=response.headers.get("Last-Modified", entry.last_modified)
+        )
+        return json_loads(entry.value)
+
+    response.raise_for_status()
+
+    value = json_loads(response.content)
+    cache.set(
+        key,
+        response.content,
+        etag=response.headers.get("ETag"),
+        last_modified=response.headers.get("Last-Modified")
+    )
+    return value
@@ -0,0 +1,82 @@
+import base64
+import gzip
+import io
+import json
+import time
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from urllib3.response import HTTPResponse
+
+
+BASE_URL = "http://polly.test"
+
+
+def make_response(status_code, body=None, headers=None, url=BASE_URL, compress=False):
+    """
+    Build a requests.Response with a JSON body. The body is also exposed as
+    a streamable `raw`, gzip-encoded when compress is set.
+    """
+    content = b"" if body is None else json.dumps(body).encode()
+    headers = CaseInsensitiveDict(headers or {})
+    raw_body = content
+    if compress:
+        raw_body = gzip.compress(content)
+        headers["Content-Encoding"] = "gzip"
+
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = content
+    response.headers = headers
+    response.url = url
+    response.raw = HTTPResponse(
+        body=io.BytesIO(raw_body),
+        headers=dict(headers),
+        status=status_code,
+        preload_content=False,
+        decode_content=False
+    )
+    return response
+
+
+def make_token(username, expires_in):
+    """
+    Build an unsigned JWT for username that expires in expires_in seconds.
+    """
+    def segment(data):
+        return base64.urlsafe_b64encode(json.dumps(data).encode()).rstrip(b"=").decode()
+
+    claims = {"sub": username, "exp": int(time.time() + expires_in)}
+    return f"{segment({'alg': 'HS256'})}.{segment(claims)}.signature"
+
+
+def poll_results(poll_id, vote_count=None):
+    return {
+        "poll_id": poll_id,
+        "question": f"Question {poll_id}?",
+        "results": [{"option_id": 1, "text": "Yes", "vote_count": poll_id if vote_count is None else vote_count}]
+    }
+
+
+class FakeSession:
+    """
+    Stands in for requests.Session: records every request and answers it
+    with handler(method, url, params, headers, data).
+    """
+
+    def __init__(self, handler):
+        self.handler = handler
+        self.calls = []
+
+    def request(self, method, url, params=None, headers=None, data=None):
+        self.calls.append((method, url, params, headers or {}))
+        response = self.handler(method, url, params, headers or {}, data)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    def get(self, url, params=None, headers=None, **kwargs):
+        return self.request("GET", url, params=params, headers=headers)
+
+    def post(self, url, data=None, headers=None, **kwargs):
+        return self.request("POST", url, headers=headers, data=data)
@@ -0,0 +1,158 @@
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.absolute()))
+import httpx
+import pytest
+
+import async_client
+from fakes import BASE_URL, poll_results
+
+
+def mock_client(handler):
+    """
+    AsyncClient whose requests are answered by handler(request) in-process.
+    """
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+def call(handler, function, *args):
+    async def main():
+        async with mock_client(handler) as client:
+            return await function(client, BASE_URL, *args)
+
+    return asyncio.run(main())
+
+
+def test_fetch_polls_async_sends_paging_params():
+    def handler(request):
+        assert request.url.params["skip"] == "5"
+        assert request.url.params["limit"] == "2"
+        return httpx.Response(200, json=[{"id": 6}, {"id": 7}])
+
+    assert call(handler, async_client.fetch_polls_async, 5, 2) == [{"id": 6}, {"id": 7}]
+
+
+def test_get_poll_results_async_returns_none_for_missing_poll(capsys):
+    def handler(request):
+        if request.url.path == "/polls/1/results":
+            return httpx.Response(200, json=poll_results(1))
+        return httpx.Response(404, json={"detail": "Poll not found"})
+
+    assert call(handler, async_client.get_poll_results_async, 1) == poll_results(1)
+    assert call(handler, async_client.get_poll_results_async, 2) is None
+    assert "Poll with ID 2 not found" in capsys.readouterr().out
+
+
+def test_register_user_async_sends_json_body():
+    def handler(request):
+        assert request.headers["Content-Type"] == "application/json"
+        return httpx.Response(200, json={"id": 1, "username": json.loads(request.content)["username"]})
+
+    assert call(handler, async_client.register_user_async, "alice", "secret")["username"] == "alice"
+
+
+def test_vote_on_poll_async_sends_bearer_token():
+    def handler(request):
+        if request.headers["Authorization"] != "Bearer good":
+            return httpx.Response(401, json={"detail": "Could not validate credentials"})
+        return httpx.Response(200, json={"id": 1, "user_id": 1, "option_id": json.loads(request.content)["option_id"]})
+
+    assert call(handler, async_client.vote_on_poll_async, 1, 2, "good")["option_id"] == 2
+    with pytest.raises(ValueError):
+        call(handler, async_client.vote_on_poll_async, 1, 2, "bad")
+
+
+# Event loop
+
+async def answer():
+    await asyncio.sleep(0)
+    return 42
+
+
+def test_run_uses_uvloop_when_available(monkeypatch):
+    calls = []
+
+    class FakeUvloop:
+        @staticmethod
+        def run(main):
+            calls.append(main)
+            return asyncio.run(main)
+
+    monkeypatch.setattr(async_client, "uvloop", FakeUvloop)
+
+    assert async_client.run(answer()) == 42
+    assert len(calls) == 1
+
+
+def test_run_falls_back_to_asyncio(monkeypatch):
+    monkeypatch.setattr(async_client, "uvloop", None)
+
+    assert async_client.run(answer()) == 42
+
+
+# Bulk lookups
+
+def batch_handler(requests_seen, supported=True, status_code=404):
+    def handler(request):
+        requests_seen.append(request)
+        if request.url.path == "/polls/results":
+            if not supported:
+                return httpx.Response(status_code, json={"detail": "Not supported"})
+            ids = [int(poll_id) for poll_id in request.url.params["ids"].split(",")]
+            return httpx.Response(200, json=[poll_results(poll_id) for poll_id in ids if poll_id <= 100])
+        poll_id = int(request.url.path.split("/")[-2])
+        if poll_id > 100:
+            return httpx.Response(404, json={"detail": "Poll not found"})
+        return httpx.Response(200, json=poll_results(poll_id))
+
+    return handler
+
+
+def test_get_poll_results_batch_async_splits_into_chunks(monkeypatch):
+    monkeypatch.setattr(async_client, "BATCH_CHUNK_SIZE", 2)
+    seen = []
+
+    results = call(batch_handler(seen), async_client.get_poll_results_batch_async, [1, 2, 3, 4, 999])
+
+    assert sorted(results) == [1, 2, 3, 4]
+    assert results[4]["question"] == "Question 4?"
+    assert [request.url.params["ids"] for request in seen] == ["1,2", "3,4", "999"]
+
+
+@pytest.mark.parametrize("status_code", [404, 405, 422])
+def test_get_poll_results_batch_async_falls_back_to_single_lookups(status_code, capsys):
+    seen = []
+
+    results = call(batch_handler(seen, supported=False, status_code=status_code),
+                   async_client.get_poll_results_batch_async, [1, 2, 999])
+
+    assert sorted(results) == [1, 2]
+    assert len(seen) == 4
+    assert "Poll with ID 999 not found" in capsys.readouterr().out
+
+
+def test_get_poll_results_batch_async_raises_other_errors():
+    with pytest.raises(httpx.HTTPError):
+        call(batch_handler([], supported=False, status_code=400), async_client.get_poll_results_batch_async, [1, 2])
+
+
+def test_gather_bounded_limits_concurrency_and_keeps_order():
+    running = 0
+    peak = 0
+
+    async def task(value):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return value
+
+    async def main():
+        return await async_client._gather_bounded([task(i) for i in range(10)], 3)
+
+    assert asyncio.run(main()) == list(range(10))
+    assert peak == 3
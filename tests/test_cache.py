@@ -0,0 +1,49 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.absolute()))
+
+from cache import TTLCache, is_fresh
+
+
+def test_set_and_get():
+    cache = TTLCache(60)
+    cache.set("key", b"value", etag='W/"1"')
+
+    entry = cache.get("key")
+
+    assert entry.value == b"value"
+    assert entry.etag == 'W/"1"'
+    assert is_fresh(entry)
+
+
+def test_expired_entries_are_kept_but_not_fresh():
+    cache = TTLCache(0)
+    cache.set("key", b"value")
+
+    entry = cache.get("key")
+
+    assert entry.value == b"value"
+    assert not is_fresh(entry)
+
+
+def test_delete_removes_only_that_entry():
+    cache = TTLCache(60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    cache.delete("a")
+    cache.delete("missing")
+
+    assert cache.get("a") is None
+    assert cache.get("b").value == 2
+
+
+def test_oldest_entry_is_evicted_when_full():
+    cache = TTLCache(60, maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("c", 3)
+
+    assert cache.get("a") is None
+    assert cache.get("c").value == 3
@@ -0,0 +1,364 @@
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.absolute()))
+import pytest
+import requests
+
+import polly_client
+import polly_http
+from fakes import BASE_URL, FakeSession, make_response, make_token, poll_results
+from polly_client import PollyClient, UnauthorizedError
+
+
+@pytest.fixture(autouse=True)
+def clear_token_cache():
+    polly_client._TOKEN_CACHE.clear()
+    yield
+    polly_client._TOKEN_CACHE.clear()
+
+
+# Token cache
+
+def auth_handler(tokens, rejected=()):
+    """
+    Handler for /login and /polls/{id}/vote. Logins hand out the next token
+    from tokens; votes carrying a token in rejected get a 401.
+    """
+    tokens = iter(tokens)
+
+    def handler(method, url, params, headers, data):
+        if url.endswith("/login"):
+            return make_response(200, {"access_token": next(tokens), "token_type": "bearer"})
+        if headers["Authorization"].split()[1] in rejected:
+            return make_response(401, {"detail": "Could not validate credentials"})
+        return make_response(200, {"id": 1, "user_id": 1, "option_id": json.loads(data)["option_id"]})
+
+    return handler
+
+
+def logins(session):
+    return [call for call in session.calls if call[1].endswith("/login")]
+
+
+def test_login_and_vote_reuses_cached_token():
+    session = FakeSession(auth_handler([make_token("alice", 3600)]))
+    client = PollyClient(BASE_URL, session=session, preconnect=False)
+
+    client.login_and_vote("alice", "secret", 1, 1)
+    vote = client.login_and_vote("alice", "secret", 1, 2)
+
+    assert vote["option_id"] == 2
+    assert len(logins(session)) == 1
+
+
+def test_login_and_vote_refreshes_token_near_expiry():
+    expiring = make_token("alice", polly_client.TOKEN_REFRESH_MARGIN_SECONDS - 5)
+    session = FakeSession(auth_handler([expiring, make_token("alice", 3600)]))
+    client = PollyClient(BASE_URL, session=session, preconnect=False)
+
+    client.login_and_vote("alice", "secret", 1, 1)
+    client.login_and_vote("alice", "secret", 1, 1)
+
+    assert len(logins(session)) == 2
+
+
+def test_login_and_vote_ignores_token_for_other_password():
+    session = FakeSession(auth_handler([make_token("alice", 3600), make_token("alice", 3600)]))
+    client = PollyClient(BASE_URL, session=session, preconnect=False)
+
+    client.login_and_vote("alice", "secret", 1, 1)
+    client.login_and_vote("alice", "other", 1, 1)
+
+    assert len(logins(session)) == 2
+
+
+def test_login_and_vote_logs_in_again_when_token_rejected():
+    revoked = make_token("alice", 3600)
+    fresh = make_token("alice", 7200)
+    session = FakeSession(auth_handler([fresh], rejected={revoked}))
+    client = PollyClient(BASE_URL, session=session, preconnect=False)
+
+    polly_client._cache_token((BASE_URL, "alice"), revoked, "secret")
+    vote = client.login_and_vote("alice", "secret", 1, 1)
+
+    assert vote["option_id"] == 1
+    assert len(logins(session)) == 1
+    assert polly_client._TOKEN_CACHE[(BASE_URL, "alice")].token == fresh
+
+
+def test_vote_on_poll_raises_unauthorized():
+    session = FakeSession(lambda *args: make_response(401, {"detail": "Could not validate credentials"}))
+    client = PollyClient(BASE_URL, session=session, preconnect=False)
+
+    with pytest.raises(UnauthorizedError):
+        client.vote_on_poll(1, 1, "token")
+
+
+# Token claims
+
+def test_get_token_claims_returns_claims_of_cached_token():
+    session = FakeSession(auth_handler([make_token("alice", 3600)]))
+    client = PollyClient(BASE_URL, session=session, preconnect=False)
+    assert client.get_token_claims("alice") is None
+
+    client.login_and_vote("alice", "secret", 1, 1)
+
+    claims = client.get_token_claims("alice")
+    assert claims["sub"] == "alice"
+    assert claims["exp"] > time.time()
+
+
+def test_get_token_claims_returns_none_once_token_expires():
+    polly_client._cache_token((BASE_URL, "alice"), make_token("alice", -1), "secret")
+    client = PollyClient(BASE_URL, session=FakeSession(None), preconnect=False)
+
+    assert client.get_token_claims("alice") is None
+
+
+def test_decode_claims_tolerates_malformed_tokens():
+    assert polly_client._decode_claims("not-a-jwt") == {}
+    assert polly_client._decode_claims("a.!!!.c") == {}
+    assert polly_client._decode_claims(make_token("alice", 60))["sub"] == "alice"
+
+
+# Pagination
+
+def paged_handler(total):
+    """
+    Handler for /polls serving `total` polls with IDs 0..total-1.
+    """
+    def handler(method, url, params, headers, data):
+        ids = range(params["skip"], min(params["skip"] + params["limit"], total))
+        return make_response(200, [{"id": poll_id} for poll_id in ids])
+
+    return handler
+
+
+def test_fetch_all_polls_concurrent_rejects_invalid_sizes():
+    client = PollyClient(BASE_URL, session=FakeSession(None), preconnect=False)
+
+    with pytest.raises(ValueError):
+        client.fetch_all_polls_concurrent(page_size=0)
+    with pytest.raises(ValueError):
+        client.fetch_all_polls_concurrent(workers=0)
+
+
+def test_fetch_all_polls_concurrent_collects_pages_in_order():
+    client = PollyClient(BASE_URL, session=FakeSession(paged_handler(23)), preconnect=False)
+
+    polls = client.fetch_all_polls_concurrent(page_size=5, workers=2)
+
+    assert [poll["id"] for poll in polls] == list(range(23))
+
+
+def test_fetch_all_polls_concurrent_stops_on_empty_page():
+    client = PollyClient(BASE_URL, session=FakeSession(paged_handler(20)), preconnect=False)
+
+    polls = client.fetch_all_polls_concurrent(page_size=5, workers=3)
+
+    assert [poll["id"] for poll in polls] == list(range(20))
+
+
+# Response cache
+
+def test_fetch_polls_returns_independent_copies():
+    session = FakeSession(lambda *args: make_response(200, [{"id": 1}, {"id": 2}]))
+    client = PollyClient(BASE_URL, session=session, preconnect=False)
+
+    client.fetch_polls(0, 2).clear()
+
+    assert client.fetch_polls(0, 2) == [{"id": 1}, {"id": 2}]
+    assert len(session.calls) == 1
+
+
+def test_vote_drops_cached_results_for_that_poll():
+    votes = {1: 0, 2: 0}
+
+    def handler(method, url, params, headers, data):
+        if url.endswith("/vote"):
+            poll_id = int(url.split("/")[-2])
+            votes[poll_id] += 1
+            return make_response(200, {"id": 1, "user_id": 1, "option_id": 1})
+        if url.endswith("/polls/results"):
+            return make_response(200, [poll_results(int(i), votes[int(i)]) for i in params["ids"].split(",")])
+        poll_id = int(url.split("/")[-2])
+        return make_response(200, poll_results(poll_id, votes[poll_id]))
+
+    session = FakeSession(handler)
+    client = PollyClient(BASE_URL, session=session, preconnect=False)
+    assert client.get_poll_results(1)["results"][0]["vote_count"] == 0
+    assert client.get_poll_results(2)["results"][0]["vote_count"] == 0
+    assert client.get_poll_results_batch([1, 2])[1]["results"][0]["vote_count"] == 0
+
+    client.vote_on_poll(1, 1, "token")
+
+    assert client.get_poll_results(1)["results"][0]["vote_count"] == 1
+    assert client.get_poll_results_batch([1, 2])[1]["results"][0]["vote_count"] == 1
+    # Other polls stay cached
+    requests_before = len(session.calls)
+    client.get_poll_results(2)
+    assert len(session.calls) == requests_before
+
+
+# Streaming
+
+def streamed_handler(total, compress=False):
+    def handler(method, url, params, headers, data):
+        ids = range(params["skip"], min(params["skip"] + params["limit"], total))
+        return make_response(200, [{"id": poll_id, "question": f"q{poll_id}"} for poll_id in ids], compress=compress)
+
+    return handler
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_fetch_polls_iter_streams_page(compress):
+    session = FakeSession(streamed_handler(3, compress=compress))
+    client = PollyClient(BASE_URL, session=session, preconnect=False)
+
+    polls = list(client.fetch_polls_iter(skip=0, limit=10))
+
+    assert polls == [{"id": 0, "question": "q0"}, {"id": 1, "question": "q1"}, {"id": 2, "question": "q2"}]
+
+
+def test_iter_all_polls_walks_every_page():
+    session = FakeSession(streamed_handler(12, compress=True))
+    client = PollyClient(BASE_URL, session=session, preconnect=False)
+
+    polls = list(client.iter_all_polls(page_size=5))
+
+    assert [poll["id"] for poll in polls] == list(range(12))
+    assert [call[2]["skip"] for call in session.calls] == [0, 5, 10]
+
+
+def test_iter_all_polls_stops_on_empty_page():
+    session = FakeSession(streamed_handler(12))
+    client = PollyClient(BASE_URL, session=session, preconnect=False)
+
+    assert list(client.iter_all_polls(page_size=0)) == []
+    assert len(session.calls) == 1
+
+
+# Batch results
+
+def batch_handler(supported=True, status_code=422):
+    """
+    Handler for /polls/results and /polls/{id}/results. Polls above 100 do
+    not exist; without batch support, /polls/results fails with status_code.
+    """
+    def handler(method, url, params, headers, data):
+        if url.endswith("/polls/results"):
+            if not supported:
+                return make_response(status_code, {"detail": "Not supported"}, url=url)
+            ids = [int(poll_id) for poll_id in params["ids"].split(",")]
+            return make_response(200, [poll_results(poll_id) for poll_id in ids if poll_id <= 100])
+        poll_id = int(url.split("/")[-2])
+        if poll_id > 100:
+            return make_response(404, {"detail": "Poll not found"}, url=url)
+        return make_response(200, poll_results(poll_id), url=url)
+
+    return handler
+
+
+def test_get_poll_results_batch_uses_one_request():
+    session = FakeSession(batch_handler())
+    client = PollyClient(BASE_URL, session=session, preconnect=False)
+
+    results = client.get_poll_results_batch([1, 2, 999])
+
+    assert sorted(results) == [1, 2]
+    assert results[2]["question"] == "Question 2?"
+    assert [call[2]["ids"] for call in session.calls] == ["1,2,999"]
+
+
+def test_get_poll_results_batch_splits_into_chunks(monkeypatch):
+    monkeypatch.setattr(polly_client, "BATCH_CHUNK_SIZE", 2)
+    session = FakeSession(batch_handler())
+    client = PollyClient(BASE_URL, session=session, preconnect=False)
+
+    results = client.get_poll_results_batch([1, 2, 3, 4, 5])
+
+    assert sorted(results) == [1, 2, 3, 4, 5]
+    assert results[3]["question"] == "Question 3?"
+    # The first chunk probes the endpoint before the rest are sent
+    assert session.calls[0][2]["ids"] == "1,2"
+    assert sorted(call[2]["ids"] for call in session.calls[1:]) == ["3,4", "5"]
+
+
+@pytest.mark.parametrize("status_code", [404, 405, 422])
+def test_get_poll_results_batch_falls_back_to_single_lookups(status_code, capsys):
+    session = FakeSession(batch_handler(supported=False, status_code=status_code))
+    client = PollyClient(BASE_URL, session=session, preconnect=False)
+
+    results = client.get_poll_results_batch([1, 2, 999])
+
+    assert sorted(results) == [1, 2]
+    assert results[2]["results"][0]["vote_count"] == 2
+    assert "Poll with ID 999 not found" in capsys.readouterr().out
+
+
+def test_get_poll_results_batch_fallback_works_inside_event_loop(capsys):
+    session = FakeSession(batch_handler(supported=False))
+    client = PollyClient(BASE_URL, session=session, preconnect=False)
+
+    async def lookup():
+        return client.get_poll_results_batch([1, 2])
+
+    assert sorted(asyncio.run(lookup())) == [1, 2]
+
+
+def test_get_poll_results_batch_raises_other_errors():
+    session = FakeSession(batch_handler(supported=False, status_code=400))
+    client = PollyClient(BASE_URL, session=session, preconnect=False)
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        client.get_poll_results_batch([1, 2])
+
+
+# Default clients
+
+def test_get_client_ignores_trailing_slash():
+    assert polly_client.get_client(BASE_URL) is polly_client.get_client(BASE_URL + "/")
+
+
+def test_default_client_uses_new_session_after_close():
+    client = polly_client.get_client(BASE_URL)
+    session = polly_http.get_session()
+    assert client._session is session
+
+    polly_http.close_session()
+
+    assert client._session is polly_http.get_session()
+    assert client._session is not session
+
+
+# Preconnect
+
+def test_first_request_waits_for_warm_up():
+    events = []
+
+    def handler(method, url, params, headers, data):
+        if params == {"limit": 0}:
+            events.append("warm-up started")
+            time.sleep(0.2)
+            events.append("warm-up finished")
+            return make_response(200, [])
+        events.append("request")
+        return make_response(200, [{"id": 1}])
+
+    client = PollyClient(BASE_URL, session=FakeSession(handler))
+
+    assert client.fetch_polls() == [{"id": 1}]
+    assert events == ["warm-up started", "warm-up finished", "request"]
+
+
+def test_preconnect_ignores_errors():
+    session = FakeSession(lambda *args: requests.exceptions.ConnectionError("down"))
+    client = PollyClient(BASE_URL, session=session)
+
+    with pytest.raises(requests.exceptions.RequestException):
+        client.fetch_polls()
+    assert session.calls[0][2] == {"limit": 0}
@@ -0,0 +1,78 @@
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.absolute()))
+import pytest
+
+import get_poll_results
+from get_poll_results import display_poll_results
+
+
+def make_results(vote_counts):
+    return {
+        "poll_id": 7,
+        "question": "Best colour?",
+        "results": [
+            {"option_id": option_id, "text": f"Option {option_id}", "vote_count": vote_count}
+            for option_id, vote_count in enumerate(vote_counts, start=1)
+        ]
+    }
+
+
+def test_display_poll_results_formats_each_option(capsys):
+    display_poll_results(make_results([1, 2]))
+
+    assert capsys.readouterr().out == (
+        "\n"
+        "Poll Results for Poll ID: 7\n"
+        "Question: Best colour?\n"
+        "\n"
+        "Results:\n"
+        + "-" * 50 + "\n"
+        "Option 1: Option 1\n"
+        "  Votes: 1 (33.3%)\n"
+        "\n"
+        "Option 2: Option 2\n"
+        "  Votes: 2 (66.7%)\n"
+        "\n"
+        "Total votes: 3\n"
+    )
+
+
+def test_display_poll_results_without_votes(capsys):
+    display_poll_results(make_results([0, 0]))
+
+    out = capsys.readouterr().out
+    assert out.count("(0.0%)") == 2
+    assert out.endswith("Total votes: 0\n")
+
+
+def test_display_poll_results_without_results(capsys):
+    display_poll_results(None)
+
+    assert capsys.readouterr().out == "No results to display\n"
+
+
+def render(results, capsys):
+    display_poll_results(results)
+    return capsys.readouterr().out
+
+
+@pytest.mark.parametrize("vote_counts", [
+    [random.Random(seed).randint(0, 50) for _ in range(get_poll_results.NUMPY_MIN_OPTIONS + 7)]
+    for seed in range(5)
+] + [[0] * get_poll_results.NUMPY_MIN_OPTIONS])
+def test_numpy_and_pure_python_paths_print_the_same(vote_counts, capsys, monkeypatch):
+    results = make_results(vote_counts)
+    calls = []
+    vectorized = get_poll_results._vote_percentages_numpy
+    monkeypatch.setattr(get_poll_results, "_vote_percentages_numpy", lambda options: calls.append(1) or vectorized(options))
+
+    with_numpy = render(results, capsys)
+    assert calls
+
+    monkeypatch.setitem(sys.modules, "numpy", None)
+    without_numpy = render(results, capsys)
+
+    assert with_numpy == without_numpy
@@ -0,0 +1,142 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.absolute()))
+import pytest
+import requests
+
+from cache import TTLCache
+from fakes import BASE_URL, FakeSession, make_response
+from polly_http import RETRY_POLICY, conditional_get, get_session
+
+
+# Conditional GET
+
+def test_conditional_get_serves_fresh_entry_without_request():
+    session = FakeSession(lambda *args: make_response(200, [1, 2]))
+    cache = TTLCache(60)
+
+    assert conditional_get(session, BASE_URL, cache) == [1, 2]
+    assert conditional_get(session, BASE_URL, cache) == [1, 2]
+    assert len(session.calls) == 1
+
+
+def test_conditional_get_returns_independent_copies():
+    session = FakeSession(lambda *args: make_response(200, [1, 2]))
+    cache = TTLCache(60)
+
+    conditional_get(session, BASE_URL, cache).append(3)
+
+    assert conditional_get(session, BASE_URL, cache) == [1, 2]
+
+
+def test_conditional_get_revalidates_expired_entry():
+    responses = iter([
+        make_response(200, [1, 2], headers={"ETag": 'W/"v1"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}),
+        make_response(304, headers={"ETag": 'W/"v1"'})
+    ])
+    session = FakeSession(lambda *args: next(responses))
+    cache = TTLCache(0)
+
+    assert conditional_get(session, BASE_URL, cache) == [1, 2]
+    assert conditional_get(session, BASE_URL, cache) == [1, 2]
+
+    headers = session.calls[1][3]
+    assert headers["If-None-Match"] == 'W/"v1"'
+    assert headers["If-Modified-Since"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+
+
+def test_conditional_get_not_modified_renews_entry():
+    responses = iter([
+        make_response(200, [1, 2], headers={"ETag": 'W/"v1"'}),
+        make_response(304, headers={"ETag": 'W/"v1"'})
+    ])
+    session = FakeSession(lambda *args: next(responses))
+    cache = TTLCache(0)
+    conditional_get(session, BASE_URL, cache)
+
+    cache.ttl_seconds = 60
+    conditional_get(session, BASE_URL, cache)
+
+    assert conditional_get(session, BASE_URL, cache) == [1, 2]
+    assert len(session.calls) == 2
+
+
+def test_conditional_get_replaces_entry_on_changed_body():
+    responses = iter([
+        make_response(200, [1, 2], headers={"ETag": 'W/"v1"'}),
+        make_response(200, [1, 2, 3], headers={"ETag": 'W/"v2"'}),
+        make_response(304, headers={"ETag": 'W/"v2"'})
+    ])
+    session = FakeSession(lambda *args: next(responses))
+    cache = TTLCache(0)
+
+    conditional_get(session, BASE_URL, cache)
+    assert conditional_get(session, BASE_URL, cache) == [1, 2, 3]
+    assert conditional_get(session, BASE_URL, cache) == [1, 2, 3]
+    assert session.calls[2][3]["If-None-Match"] == 'W/"v2"'
+
+
+def down_after_first_request():
+    responses = iter([
+        make_response(200, [1, 2]),
+        requests.exceptions.ConnectionError("down")
+    ])
+    return FakeSession(lambda *args: next(responses))
+
+
+def test_conditional_get_raises_on_connection_error_by_default():
+    session = down_after_first_request()
+    cache = TTLCache(0)
+
+    conditional_get(session, BASE_URL, cache)
+    with pytest.raises(requests.exceptions.ConnectionError):
+        conditional_get(session, BASE_URL, cache)
+
+
+def test_conditional_get_serves_recently_expired_entry_when_allowed():
+    session = down_after_first_request()
+    cache = TTLCache(0)
+
+    conditional_get(session, BASE_URL, cache)
+    assert conditional_get(session, BASE_URL, cache, stale_if_error=60) == [1, 2]
+
+
+def test_conditional_get_does_not_serve_entry_past_stale_window():
+    session = down_after_first_request()
+    cache = TTLCache(-120)
+
+    conditional_get(session, BASE_URL, cache)
+    with pytest.raises(requests.exceptions.ConnectionError):
+        conditional_get(session, BASE_URL, cache, stale_if_error=60)
+
+
+def test_conditional_get_without_entry_raises_on_connection_error():
+    session = FakeSession(lambda *args: requests.exceptions.ConnectionError("down"))
+
+    with pytest.raises(requests.exceptions.ConnectionError):
+        conditional_get(session, BASE_URL, TTLCache(60), stale_if_error=60)
+
+
+# Retries
+
+def test_session_retries_with_policy():
+    assert get_session().get_adapter(BASE_URL).max_retries is RETRY_POLICY
+
+
+def test_retry_policy_retries_get_on_server_errors():
+    assert RETRY_POLICY.is_retry("GET", 500)
+    assert RETRY_POLICY.is_retry("GET", 503)
+    assert not RETRY_POLICY.is_retry("GET", 404)
+
+
+def test_retry_policy_only_replays_post_when_turned_away():
+    assert not RETRY_POLICY.is_retry("POST", 500)
+    assert not RETRY_POLICY.is_retry("POST", 503)
+    assert RETRY_POLICY.is_retry("POST", 503, has_retry_after=True)
+    assert RETRY_POLICY.is_retry("POST", 429, has_retry_after=True)
+    assert not RETRY_POLICY.is_retry("POST", 500, has_retry_after=True)
+
+
+def test_retry_policy_returns_last_response_when_exhausted():
+    assert not RETRY_POLICY.raise_on_status
@@ -133,6 +133,42 @@ def test_get_poll_results():
     assert data["results"][0]["vote_count"] == 1
 
 
+def test_get_poll_results_not_modified():
+    response = client.get(f"/polls/{poll_id}/results")
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    response = client.get(
+        f"/polls/{poll_id}/results", headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+
+def test_large_responses_are_compressed():
+    response = client.get("/openapi.json", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert "paths" in response.json()
+
+
+def test_get_polls_results_batch():
+    response = client.get("/polls/results", params={"ids": f"{poll_id},9999"})
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data) == 1
+    assert data[0]["poll_id"] == poll_id
+    assert data[0]["question"] == "Is this a test poll?"
+    assert data[0]["results"][0]["option_id"] == option_id
+    assert data[0]["results"][0]["vote_count"] == 1
+    assert data[0]["results"][1]["vote_count"] == 0
+
+
+def test_get_polls_results_batch_invalid_ids():
+    response = client.get("/polls/results", params={"ids": "1,abc"})
+    assert response.status_code == 400
+
+
 def test_delete_poll():
     headers = {"Authorization": f"Bearer {token}"}
     response = client.delete(f"/polls/{poll_id}", headers=headers)
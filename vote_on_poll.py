@@ -1,10 +1,14 @@
 import requests
 from typing import Dict, Optional
 
+from polly_client import get_client
+
 def vote_on_poll(base_url: str, poll_id: int, option_id: int, access_token: str) -> Dict:
     """
     Cast a vote on an existing poll.
     
+    Delegates to PollyClient.vote_on_poll() on the default client for base_url.
+    
     Args:
         base_url (str): The base URL of the API (e.g., 'http://localhost:8000')
         poll_id (int): The ID of the poll to vote on
@@ -22,41 +26,14 @@ def vote_on_poll(base_url: str, poll_id: int, option_id: int, access_token: str)
         requests.exceptions.RequestException: If the request fails
         ValueError: If the server returns an error response
     """
-    # Prepare the endpoint URL
-    url = f"{base_url.rstrip('/')}/polls/{poll_id}/vote"
-    
-    # Prepare the request payload
-    payload = {
-        "option_id": option_id
-    }
-    
-    # Set headers for JSON content and authentication
-    headers = {
-        "Content-Type": "application/json",
-        "Authorization": f"Bearer {access_token}"
-    }
-    
-    try:
-        # Make the POST request
-        response = requests.post(url, json=payload, headers=headers)
-        
-        # Check if the request was successful
-        if response.status_code == 200:
-            return response.json()
-        elif response.status_code == 401:
-            raise ValueError("Unauthorized: Invalid or expired access token")
-        elif response.status_code == 404:
-            raise ValueError(f"Poll with ID {poll_id} not found or option with ID {option_id} not found")
-        else:
-            response.raise_for_status()
-            
-    except requests.exceptions.RequestException as e:
-        raise requests.exceptions.RequestException(f"Failed to cast vote: {e}")
+    return get_client(base_url).vote_on_poll(poll_id, option_id, access_token)
 
 def login_and_vote(base_url: str, username: str, password: str, poll_id: int, option_id: int) -> Dict:
     """
     Convenience function that logs in a user and casts a vote in one operation.
     
+    Delegates to PollyClient.login_and_vote() on the default client for base_url.
+    
     Args:
         base_url (str): The base URL of the API
         username (str): Username for authentication
@@ -71,33 +48,7 @@ def login_and_vote(base_url: str, username: str, password: str, poll_id: int, op
         requests.exceptions.RequestException: If any request fails
         ValueError: If login fails or voting fails
     """
-    # First, log in to get the access token
-    login_url = f"{base_url.rstrip('/')}/login"
-    login_data = {
-        "username": username,
-        "password": password
-    }
-    login_headers = {
-        "Content-Type": "application/x-www-form-urlencoded"
-    }
-    
-    try:
-        # Make login request
-        login_response = requests.post(login_url, data=login_data, headers=login_headers)
-        
-        if login_response.status_code == 200:
-            token_data = login_response.json()
-            access_token = token_data["access_token"]
-        elif login_response.status_code == 400:
-            raise ValueError("Login failed: Incorrect username or password")
-        else:
-            login_response.raise_for_status()
-        
-        # Now cast the vote using the obtained token
-        return vote_on_poll(base_url, poll_id, option_id, access_token)
-        
-    except requests.exceptions.RequestException as e:
-        raise requests.exceptions.RequestException(f"Failed to login and vote: {e}")
+    return get_client(base_url).login_and_vote(username, password, poll_id, option_id)
 
 # Example usage
 if __name__ == "__main__":